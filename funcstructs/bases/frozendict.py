@@ -40,7 +40,7 @@ class frozendict(object):
     with tuples, may still be mutable. If all of frozendict's values
     are hashable, then so is frozendict."""
 
-    __slots__ = '_mapping'  # allocate slot for iternal dict
+    __slots__ = '_mapping', '_hash'  # allocate slots for iternal dict, hash
 
 
 # Store accessor and setter for the member descriptor.
@@ -65,7 +65,13 @@ def _map_accessors(_map_set=frozendict._mapping.__set__,
 @_FunctionType.__call__
 def _FrozendictHelper():
     """Add wrappers for `dict`'s methods to frozendict."""
+    # frozendicts never change, so their hash is computed once and stored in
+    # a second hidden slot. Instances made without calling frozendict.__new__
+    # leave it unset, so it is filled in lazily by __hash__.
+    hash_set, hash_get = frozendict._hash.__set__, frozendict._hash.__get__
+
     del frozendict._mapping  # destroy external access to the mapping
+    del frozendict._hash
     del frozendict.__slots__  # make it look like a builtin type
 
     map_set, map_get = _map_accessors()
@@ -213,7 +219,12 @@ def _FrozendictHelper():
     @add_with_docs
     def __hash__(self):
         # default hash independent of overridden items
-        return hash(frozenset(map_get(self).items()))
+        try:
+            return hash_get(self)
+        except AttributeError:
+            h = hash(frozenset(map_get(self).items()))
+            hash_set(self, h)
+            return h
 
     if hasattr(dict, 'itervalues'):
         @add_with_docs
@@ -244,7 +255,12 @@ def _FrozendictHelper():
 
         @add_with_docs
         def __hash__(self):
-            return hash(frozenset(map_get(self).viewitems()))
+            try:
+                return hash_get(self)
+            except AttributeError:
+                h = hash(frozenset(map_get(self).viewitems()))
+                hash_set(self, h)
+                return h
 
         # Calling frozendict.method in python2 returns an "unbound method type"
         # instead of a function, so access class __dict__ directly.
@@ -20,6 +20,36 @@ except ImportError:
             total = func(total, element)
             yield total
 
+try:
+    from functools import lru_cache  # use C speed memoization if > py3.2
+except ImportError:
+    from functools import wraps
+
+    def lru_cache(maxsize=128, typed=False):
+        """Memoize a function of hashable positional arguments. Unlike
+        the python3 version, typed is ignored, and rather than evicting
+        the least recently used entry, a full cache is cleared entirely.
+        A maxsize of None leaves the cache unbounded."""
+        def decorating_function(user_function):
+            cache = {}
+
+            @wraps(user_function)
+            def wrapper(*args):
+                try:
+                    return cache[args]
+                except KeyError:
+                    result = user_function(*args)
+                    if maxsize is not None:
+                        if maxsize <= 0:
+                            return result
+                        if len(cache) >= maxsize:
+                            cache.clear()
+                    cache[args] = result
+                    return result
+            wrapper.cache_clear = cache.clear
+            return wrapper
+        return decorating_function
+
 
 # Copied directly from the six compatibility module
 def with_metaclass(meta, *bases):
@@ -21,7 +21,8 @@ class Location2D(with_metaclass(abc.ABCMeta, object)):
     Like all coordinates, they require a representation. The user must
     specify a location's representation in the complex plane, returned
     by the abstract property 'z'. Conversions to Cartesian and Polar
-    are provided.
+    are provided. Arithmetic reads the Cartesian components from the
+    attributes _x and _y, which subclasses must also set.
     """
 
     __slots__ = ()
@@ -31,10 +32,15 @@ class Location2D(with_metaclass(abc.ABCMeta, object)):
         """Locations as points on the complex plane"""
         return 0
 
+    @classmethod
+    def _from_xy(cls, x, y):
+        """Form points from validated Cartesian components."""
+        return cls(x + 1j*y)
+
     @classmethod
     def from_polar(cls, r, theta):
         """Form points from polar coordinates."""
-        return cls(r*np.exp(1j*theta))
+        return cls._from_xy(r*np.cos(theta), r*np.sin(theta))
 
     @property
     def x(self):
@@ -49,29 +55,39 @@ class Location2D(with_metaclass(abc.ABCMeta, object)):
     def __abs__(self):
         return np.abs(self.z)
 
-    r = property(__abs__, doc="Radial component of the polar representation.")
+    @property
+    def r(self):
+        """Radial component of the polar representation."""
+        return abs(self)
 
     @property
     def theta(self):
         """Angular component of the polar representation"""
-        return np.arctan2(self.y, self.x)
+        return np.arctan2(self._y, self._x)
+
+    def polar(self):
+        """Return the radial and angular components together."""
+        x, y = self._x, self._y
+        return np.hypot(x, y), np.arctan2(y, x)
 
     def __add__(self, other):
         """Change to coordinates in which old origin is now at other in new"""
-        return self.__class__(self.z + Point(other).z)
+        other = _as_point(other)
+        return self._from_xy(self._x + other._x, self._y + other._y)
 
     def __neg__(self):
         """Reflection about the origin"""
-        return self.__class__(-self.z)
+        return self._from_xy(-self._x, -self._y)
 
     def __sub__(self, other):
         """Change to coordinates such that new origin is at other in the old"""
-        return -(-self + other)
+        other = _as_point(other)
+        return self._from_xy(self._x - other._x, self._y - other._y)
 
     def __rmul__(self, other):
         """Scale self by real value other. """
         if isinstance(other, Real):
-            return self.__class__(other*self.z)
+            return self._from_xy(other*self._x, other*self._y)
         raise TypeError("Cannot multiply coordinates by %s" % type(other))
 
     def __div__(self, other):
@@ -82,9 +98,18 @@ class Location2D(with_metaclass(abc.ABCMeta, object)):
 
     def rotated(self, angle, origin=0):
         """Locations rotated by given angle about the given origin."""
-        coords = self - origin
-        r, theta = coords.r, coords.theta
-        return self.from_polar(r, theta + angle) + origin
+        c, s = np.cos(angle), np.sin(angle)
+        origin = _as_point(origin)
+        dx, dy = self._x - origin._x, self._y - origin._y
+        # Accumulate in place to limit the number of temporary arrays.
+        x = c*dx
+        x -= s*dy
+        x += origin._x
+        dx *= s
+        dy *= c
+        dy += dx
+        dy += origin._y
+        return self._from_xy(x, dy)
 
 
 def _check_real_type(xt, yt):
@@ -94,6 +119,23 @@ def _check_real_type(xt, yt):
                         (xt.__name__, yt.__name__))
 
 
+def _check_real_dtype(xd, yd):
+    """Check that numpy dtypes xd and yd hold real numbers."""
+    # Comparing dtype kinds avoids the slower issubclass check on the Real
+    # ABC; numpy's integer and floating scalar types are exactly 'i', 'u'
+    # and 'f'.
+    if not(xd.kind in 'iuf' and yd.kind in 'iuf'):
+        raise TypeError("Expected real coordinates, received %s and %s" %
+                        (xd.type.__name__, yd.type.__name__))
+
+
+def _asarray(seq):
+    """Convert seq to a numpy array, copying it only if it is not one."""
+    if isinstance(seq, np.ndarray):
+        return seq
+    return np.array(list(seq))  # call list since numpy can't take iterables
+
+
 class Point(Location2D):
     """Point(x, y=None).
 
@@ -107,7 +149,9 @@ class Point(Location2D):
     >>> Point(Point(1, 2))
     """
 
-    __slots__ = "_coord"
+    # Points are immutable, so store the components alongside the complex
+    # value rather than recomputing them on every access.
+    __slots__ = "_coord", "_x", "_y"
 
     def __init__(self, x, y=None):
         if y is not None:
@@ -118,17 +162,38 @@ class Point(Location2D):
             _check_real_type(x.__class__, y.__class__)
             z = x + 1j*y
         else:
-            z = complex(x)
-        self._coord = z
+            z = x
+        self._coord = z = complex(z)
+        self._x = z.real
+        self._y = z.imag
+
+    @classmethod
+    def _from_xy(cls, x, y):
+        """Form a point from real components, skipping input checks."""
+        self = cls.__new__(cls)
+        self._x = x = float(x)
+        self._y = y = float(y)
+        self._coord = complex(x, y)
+        return self
 
     @property
     def z(self):
-        return complex(self._coord)
+        return self._coord
+
+    @property
+    def x(self):
+        """Horizontal component of the Cartesian representation."""
+        return self._x
+
+    @property
+    def y(self):
+        """Vertical component of the Cartesian representation."""
+        return self._y
 
     def __mul__(self, other):
         """Dot product with other vector."""
-        other = Point(other)
-        return self.x * other.x + self.y * other.y
+        other = _as_point(other)
+        return self._x*other._x + self._y*other._y
 
     def __repr__(self):
         return self.__class__.__name__+'(%s, %s)' % (self.x, self.y)
@@ -145,6 +210,14 @@ class Point(Location2D):
         return self.z
 
 
+def _as_point(p):
+    """Convert p to a Point, skipping the constructor if it already is one."""
+    # Points are immutable, so an existing one may be reused as is.
+    if isinstance(p, Point):
+        return p
+    return Point(p)
+
+
 class Coordinates(Location2D):
     """Coordinates(x, y=None)
 
@@ -160,47 +233,87 @@ class Coordinates(Location2D):
     >>> Coordinates([1+2j, 3+4j, 5+6j])
     """
 
-    __slots__ = "_coords"
+    # Components are kept in separate contiguous read-only float arrays, so
+    # arithmetic can work on them directly without strided views or copies.
+    __slots__ = "_x", "_y"
 
     def __init__(self, x, y=None):
         if y is not None:
-            x = np.array(list(x))  # call list since numpy can't take iterables
-            y = np.array(list(y))
-            _check_real_type(x.dtype.type, y.dtype.type)
+            x = _asarray(x)
+            y = _asarray(y)
+            _check_real_dtype(x.dtype, y.dtype)
             if x.shape != y.shape:
                 raise ValueError("Inputs must be equal length")
-            z = x + 1j*y
+        elif isinstance(x, np.ndarray) and x.dtype.kind == 'c':
+            x, y = x.real, x.imag  # no need to validate each point
         else:
-            z = np.array(list(map(Point, x)), dtype=object).astype(complex)
-        if z.ndim != 1:
+            # Read the components off each point directly, rather than
+            # converting an object array of Points back through complex.
+            points = [_as_point(p) for p in x]
+            x = np.array([p._x for p in points], dtype=float)
+            y = np.array([p._y for p in points], dtype=float)
+        if x.ndim != 1:
             raise TypeError("Input must be 1D array of coordinates")
-        self._coords = z
+        # Copy, since the stored arrays are made read-only.
+        self._set_xy(np.array(x, dtype=float), np.array(y, dtype=float))
+
+    def _set_xy(self, x, y):
+        """Store the x and y components as read-only arrays."""
+        self._x = x
+        self._y = y
+        self._x.flags.writeable = self._y.flags.writeable = False
+
+    @classmethod
+    def _from_xy(cls, x, y):
+        """Make coordinates from validated x and y component arrays.
+
+        The arrays are copied before being made read-only, so those passed
+        in are left writeable.
+        """
+        self = cls.__new__(cls)
+        self._set_xy(np.array(x, dtype=float), np.array(y, dtype=float))
+        return self
 
     @property
     def z(self):
-        return self._coords.copy()
+        return self._x + 1j*self._y
+
+    @property
+    def x(self):
+        """Horizontal components of the Cartesian representation."""
+        return self._x.copy()
+
+    @property
+    def y(self):
+        """Vertical components of the Cartesian representation."""
+        return self._y.copy()
+
+    def __abs__(self):
+        return np.hypot(self._x, self._y)
 
     def __repr__(self):
         return self.__class__.__name__+'(%s)' % list(self)
 
     def __len__(self):
         """Number of points in the set"""
-        return len(self.z)
+        return len(self._x)
 
     def __iter__(self):
         """Enumerate all points in z."""
-        for p in self.z:
-            yield Point(p)
+        # tolist converts to python floats in one pass over each array
+        for x, y in zip(self._x.tolist(), self._y.tolist()):
+            yield Point._from_xy(x, y)
 
     def __getitem__(self, key):
         """Return the nth point in the cloud"""
         if isinstance(key, int):
-            return Point(self.z[key])
-        return Coordinates(self.z[key])
+            return Point._from_xy(self._x[key], self._y[key])
+        return self._from_xy(self._x[key], self._y[key])
 
     def rotate(self, angle, origin=0):
         """In place rotation of the array."""
-        self._coords = self.rotated(angle, origin).z
+        rotated = self.rotated(angle, origin)
+        self._x, self._y = rotated._x, rotated._y
 
     def plot(self, ax=None, *args, **kwargs):
         """Draw connected sequence of points"""
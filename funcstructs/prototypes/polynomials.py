@@ -4,7 +4,6 @@ Caleb Levy, 2014 and 2015.
 """
 
 import collections
-from functools import reduce
 from itertools import repeat
 
 import numpy as np
@@ -53,15 +52,60 @@ def monomial_symmetric_polynomial(x, powers):
     T[(1, )*l] = 1
 
     # The powers use up sum(multiplcities) of the original x.
-    for k in range(n-sum(mults)+1):
-        for ind in productrange(*[(1, s) for s in shape]):
+    steps = range(n-sum(mults)+1)
+    # Updating a level of terms at once only pays for numpy's indexing
+    # overhead once the levels hold several terms on average.
+    if np.prod([i+1 for i in mults]) < 5*(sum(mults)+1):
+        _recurse_by_term(T, x, pows, steps)
+    else:
+        _recurse_by_level(T, x, pows, steps)
+
+    return T[tuple(i-1 for i in shape)]
+
+
+def _recurse_by_term(T, x, pows, steps):
+    """Apply the monomial symmetric polynomial recursion to T one term at a
+    time."""
+    l = len(pows)
+    for k in steps:
+        for ind in productrange(*[(1, s) for s in T.shape]):
             fac = x[k+sum(ind)-l-1]
             for j in range(l):
                 ind_prev = list(ind)
                 ind_prev[j] -= 1
                 T[ind] += fac**pows[j]*T[tuple(ind_prev)]
 
-    return T[tuple(i-1 for i in shape)]
+
+def _recurse_by_level(T, x, pows, steps):
+    """Apply the monomial symmetric polynomial recursion to T one level of
+    terms at a time."""
+    # Each term only depends on terms whose indices sum to one less than
+    # its own, and the value of x it is multiplied by depends only on that
+    # sum. Group the terms by their index sum, so the recursion can be
+    # applied to each group at once instead of one term at a time. Terms
+    # are addressed by their position in the flattened array, where
+    # decrementing the jth index is the same as subtracting its stride.
+    l = len(pows)
+    shape = T.shape
+    T_flat = T.reshape(-1)
+    strides = [int(np.prod(shape[j+1:])) for j in range(l)]
+    cells = np.indices([s-1 for s in shape]).reshape(l, -1) + 1
+    levels = cells.sum(axis=0)
+    positions = np.ravel_multi_index(tuple(cells), shape)
+    level_positions = []
+    for level in range(l, levels.max()+1):
+        pos = positions[levels == level]
+        if len(pos) == 1:
+            pos = int(pos[0])  # Plain int indexing is cheaper for one term.
+        level_positions.append((level, pos))
+
+    for k in steps:
+        for level, pos in level_positions:
+            fac = x[k+level-l-1]
+            for j in range(l):
+                # Multiply on the right, since the array's elements may not
+                # know how to multiply by an ndarray.
+                T_flat[pos] += T_flat[pos-strides[j]]*fac**pows[j]
 
 
 def FOIL(roots):
@@ -71,8 +115,21 @@ def FOIL(roots):
     with leading coefficient 1 given by
         (X - roots[0]) * (X - roots[1]) * ... * (X - roots[-1])
     """
-    monomials = [(1, -root) for root in roots]
-    return tuple(reduce(np.polymul, monomials, np.array([1], dtype=object)))
+    # Polynomial multiplication is convolution of the coefficients; call
+    # np.convolve directly rather than through np.polymul's poly1d checks.
+    # Coefficients stay as objects, since they can overflow fixed width ints.
+    polys = [np.array([1, -root], dtype=object) for root in roots]
+    if not polys:
+        return (1, )
+    # Multiply adjacent pairs until one polynomial remains, so factors are
+    # of similar degree instead of growing one monomial at a time.
+    while len(polys) > 1:
+        pairs = zip(polys[::2], polys[1::2])
+        products = [np.convolve(p, q) for p, q in pairs]
+        if len(polys) % 2:
+            products.append(polys[-1])
+        polys = products
+    return tuple(polys[0])
 
 
 def newton_elementary_polynomial(x, n):
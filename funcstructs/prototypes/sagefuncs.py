@@ -137,24 +137,6 @@ class GraphCompositionTests(unittest.TestCase):
         self.assertTrue(G.is_isomorphic(random_relabelling(G)))
 
 
-G = sage.DiGraph({
-    1: [2, 8],
-    2: [3],
-    3: [4],
-    4: [5, 1],
-    5: [6],
-    6: [7],
-    7: [5, 8],
-    8: [9],
-    9: [10],
-    10: [11],
-    11: [8]
-})
-
-scriptplot(G)
-scriptplot(random_relabelling(G))
-
-
 def selfmark(G):
     """Return digraph G with each vertex mapping to itself."""
     d = {v: G.neighbors_out(v) for v in G}
@@ -163,18 +145,39 @@ def selfmark(G):
     return sage.DiGraph(d)
 
 
-G = selfmark(G)
-print(iterate(G, 2).strongly_connected_components())
-scriptplot(iterate(G, 2))
-scriptplot(iterate(G, 3))
-GR = random_digraph(20)
-print(len(GR.edges()))
-scriptplot(GR)
-print(GR.strongly_connected_components())
-GR_Sparse = random_digraph(100, .01)
-print(len(GR_Sparse.edges()))
-print(GR_Sparse.strongly_connected_components())
-scriptplot(GR_Sparse)
+def demo():
+    """Plot a few example graphs and their iterates."""
+    G = sage.DiGraph({
+        1: [2, 8],
+        2: [3],
+        3: [4],
+        4: [5, 1],
+        5: [6],
+        6: [7],
+        7: [5, 8],
+        8: [9],
+        9: [10],
+        10: [11],
+        11: [8]
+    })
+
+    scriptplot(G)
+    scriptplot(random_relabelling(G))
+
+    G = selfmark(G)
+    print(iterate(G, 2).strongly_connected_components())
+    scriptplot(iterate(G, 2))
+    scriptplot(iterate(G, 3))
+    GR = random_digraph(20)
+    print(len(GR.edges()))
+    scriptplot(GR)
+    print(GR.strongly_connected_components())
+    GR_Sparse = random_digraph(100, .01)
+    print(len(GR_Sparse.edges()))
+    print(GR_Sparse.strongly_connected_components())
+    scriptplot(GR_Sparse)
+
 
 if __name__ == '__main__':
+    demo()
     unittest.main()
@@ -19,7 +19,8 @@ from funcstructs.utils import split, subsequences
 from .functions import rangefunc, Endofunction
 from .multiset import Multiset
 from .necklaces import Necklace, FixedContentNecklaces
-from .rootedtrees import _levels_from_preim, DominantSequence, TreeEnumerator
+from .rootedtrees import (
+    _levels_from_preim, _dominant_sequence, DominantSequence, TreeEnumerator)
 
 
 __all__ = ("ConjugacyClass", "Funcstructs")
@@ -54,14 +55,16 @@ class ConjugacyClass(Multiset):
     def __new__(cls, f=()):
         if isinstance(f, Endofunction):
             cycles = []
-            treenodes = f.acyclic_ancestors
-            for cycle in f.cycles():
+            funccycles = f._cycles()
+            treenodes = f._acyclic_preimage(funccycles)
+            for cycle in funccycles:
                 trees = []
                 for x in cycle:
                     # Use DominantSequence instead of RootedTree due to
-                    # python's recursion limit, and for speed.
-                    trees.append(
-                        DominantSequence(_levels_from_preim(treenodes, x)))
+                    # python's recursion limit, and for speed. The level
+                    # sequence is valid by construction, so skip the checks.
+                    trees.append(_dominant_sequence(
+                        tuple(_levels_from_preim(treenodes, x))))
                 cycles.append(Necklace(trees))
             return super(ConjugacyClass, cls).__new__(cls, cycles)
         else:
@@ -115,19 +118,24 @@ class ConjugacyClass(Multiset):
 
     def func_form(self):
         """Return a representative endofunction defined on range(n)."""
-        # ::TODO:: Comments on process
-        func = []
-        root_node = end_node = 0
+        # Nodes are labelled in order, tree by tree, and func is filled in
+        # a single pass. Each tree's nodes are grafted onto their parents
+        # as in LevelSequence.parents (inlined to avoid a generator per
+        # tree), after which its root is pointed at the root of the next
+        # tree in the cycle, or back to the first if it is the last.
+        func = [0]*len(self)
+        node = 0
         for cycle in self:
-            cycle_start = len(func)
+            cycle_start = node
             for tree in cycle:
-                end_node += len(tree)
-                # Form tree function labelled with the acyclic nodes
-                func.extend(node+root_node for node in tree.parents())
-                # Permute the cyclic nodes to form the cycle decomposition
-                func[root_node] = end_node
-                root_node = end_node
-            func[root_node-len(tree)] = cycle_start
+                root = node
+                grafting_point = [root]*len(tree)
+                for level in tree:
+                    func[node] = grafting_point[level-1]
+                    grafting_point[level] = node
+                    node += 1
+                func[root] = node
+            func[root] = cycle_start
         return rangefunc(func)
 
     def imagepath(self):
@@ -217,10 +225,11 @@ def _partitions(n):
 def integer_funcstructs(n):
     """Enumerate endofunction structures on n elements. Equivalent to
     all conjugacy classes in TransformationMonoid(n)."""
+    memo = {}
     for i in range(1, n+1):
         # TODO: partition micro-benchmarks using groupby vs Multiset.
         for partition in _partitions(i):
-            for struct in cycle_type_funcstructs(n, partition):
+            for struct in cycle_type_funcstructs(n, partition, memo):
                 yield struct
 
 
@@ -251,18 +260,21 @@ def integer_funcstructs(n):
 # The next section describes such a mechanism.
 
 
-def cycle_type_funcstructs(node_count, cycle_type):
+def cycle_type_funcstructs(node_count, cycle_type, memo=None):
     """Enumerate all conjugacy classes with the given node count and cycle
-    type."""
+    type. Attachments are memoized in memo, if given, else in a new dict
+    for this enumeration."""
+    if memo is None:
+        memo = {}
     n = node_count - sum(cycle_type)
     k = cycle_type.num_unique_elements()
     lengths, mults = split(cycle_type)
     for composition in weak_compositions(n, k):
         cycle_groups = []
         for c, l, m in zip(composition, lengths, mults):
-            cycle_groups.append(component_groups(c, l, m))
+            cycle_groups.append(component_groups(c, l, m, memo))
         for bundle in product(*cycle_groups):
-            yield Multiset.__new__(ConjugacyClass, chain(*bundle))
+            yield Multiset.__new__(ConjugacyClass, chain.from_iterable(bundle))
 
 
 # Twelve-Fold Path: Item #10
@@ -327,12 +339,16 @@ def _unordered_product(mset, iterfunc):
     except it runs through each element once. This program makes the
     assumptions that no two members of iterfunc(el) are the same, and that if
     el1 != el2 then iterfunc(el1) and iterfunc(el2) are mutually disjoint."""
-    mset = Multiset(mset)
+    # Only the multiplicities are needed, so count them in a plain dict
+    # rather than building a Multiset for every partition.
+    counts = {}
+    for y in mset:
+        counts[y] = counts.get(y, 0) + 1
     strands = []
-    for y, d in mset._items():
+    for y, d in counts.items():
         strands.append(combinations_with_replacement(iterfunc(y), d))
     for bundle in product(*strands):
-        yield chain(*bundle)
+        yield chain.from_iterable(bundle)
 
 
 # The "unorderedness" of the product is an important and subtle detail.
@@ -345,18 +361,29 @@ def _unordered_product(mset, iterfunc):
 # length l.
 
 
-def component_groups(t, l, m):
+def component_groups(t, l, m, memo=None):
     """Enumerate ways to make rooted trees from t free nodes and attach
     them to a group of m cycles of length l.
+
+    The attachments to each cycle are stored in the dict memo, keyed by
+    their node count and cycle length, so they can be shared between
+    calls.
     """
+    if memo is None:
+        memo = {}
+
+    def attachments(y):
+        # Each element of the partition corresponds to a cycle. Due to
+        # the way they are enumerated, each bin of the partition has an
+        # extra node, which must be taken out, hence the "y-1" term
+        try:
+            return memo[y-1, l]
+        except KeyError:
+            forests = memo[y-1, l] = tuple(attachment_forests(y-1, l))
+            return forests
+
     for partition in direct_unordered_attachments(t, m):
-        for cycle_group in _unordered_product(
-                partition,
-                # Each element of the partition corresponds to a cycle.
-                # Due to the way they are enumerated, each bin of the
-                # partition has an extra node, which must be taken
-                # out, hence the "y-1" term
-                lambda y: attachment_forests(y-1, l)):
+        for cycle_group in _unordered_product(partition, attachments):
             # must expand out into list or else the chain object will
             # be consumed when taking the product of the component groups
             yield list(cycle_group)
@@ -381,13 +408,16 @@ def component_groups(t, l, m):
 # Thus, to find the attachments, we enumerate every forest with precisely
 # as many trees as there are elements in the cycle, then enumerate the
 # necklaces whose elements are the trees of the forest.
+#
+# The same attachments are needed for every cycle of length l in every
+# cycle type and allocation of tree nodes, so component_groups memoizes
+# them for the duration of an enumeration.
 
 
 def attachment_forests(t, l):
     """Enumerate all ways to make rooted trees from t free nodes and attach
     them to a a cycle of length l."""
     for partition in direct_unordered_attachments(t, l):
-        # TODO: get rid of duplicate Multiset madness here
         for forest in _unordered_product(partition, TreeEnumerator):
             for necklace in FixedContentNecklaces(forest):
                 yield necklace
@@ -24,21 +24,39 @@ image sizes set can be O(n) (and has a lovely closed form formula).
 Caleb Levy, 2013, 2014 and 2015.
 """
 
+from itertools import product
 from math import factorial
 
 import numpy as np
 
 from funcstructs import combinat
+from funcstructs.compat import lru_cache
 
-from . import conjstructs, functions
+from . import conjstructs
 
 
-def iterdist_brute(n):
-    """Calculate iterdist by enumerating all endofunction image paths."""
+def iterdist_brute(n, block_width=6):
+    """Calculate iterdist by enumerating all endofunction image paths.
+
+    Functions are iterated in lockstep as rows of an array. To bound
+    memory, the rows are processed in blocks of n**block_width functions
+    sharing their first n-block_width values."""
     dist = np.zeros((n, n-1), dtype=object)
-    for f in functions.TransformationMonoid(n):
-        for it, card in enumerate(f.imagepath()):
-            dist[card-1, it] += 1
+    width = min(n, block_width)
+    tail = np.indices((n, )*width).reshape(width, -1).T
+    rows = np.arange(len(tail))[:, np.newaxis]
+    funcs = np.empty((len(tail), n), dtype=np.intp)
+    funcs[:, n-width:] = tail
+    image = np.empty(funcs.shape, dtype=bool)
+    for head in product(range(n), repeat=n-width):
+        funcs[:, :n-width] = head
+        f_iter = funcs
+        for it in range(n-1):
+            image[:] = False
+            image[rows, f_iter] = True
+            cards = np.count_nonzero(image, axis=1)
+            dist[:, it] += np.bincount(cards-1, minlength=n).astype(object)
+            f_iter = funcs[rows, f_iter]
     return dist
 
 
@@ -52,14 +70,28 @@ def iterdist_funcstruct(n, cycle_type=None):
         c = 0 if(cycle_type or sum(cycle_type) != 1) else 1
         return np.array([c], dtype=object)
     dist = np.zeros((n, n-1), dtype=object)
+    path_counts = {}
     nfac = factorial(n)
     for struct in conjstructs.Funcstructs(n, cycle_type):
         mult = nfac//struct.degeneracy()
-        for it, card in enumerate(struct.imagepath()):
-            dist[card-1, it] += mult
+        path = struct.imagepath()
+        path_counts[path] = path_counts.get(path, 0) + mult
+    # Far fewer image paths than structures exist, so accumulate their
+    # multiplicities in a dict and only index the object array at the end.
+    iterates = np.arange(n-1)
+    for path, mult in path_counts.items():
+        dist[np.subtract(path, 1), iterates] += mult
     return dist
 
-iterdist = iterdist_funcstruct
+
+def iterdist(n, cycle_type=None):
+    """Distribution of image sizes of the iterates of all endofunctions on n
+    nodes, optionally restricted to a given cycle type."""
+    # Batching every function through numpy beats enumerating structures
+    # until the n**n functions vastly outnumber the structures.
+    if cycle_type is None and 1 < n <= 5:
+        return iterdist_brute(n)
+    return iterdist_funcstruct(n, cycle_type)
 
 
 def imagedist_composition(n):
@@ -93,14 +125,22 @@ def imagedists_upto(n):
         dist[0, i] = dist[i, i] = 1
         for j in range(i):
             dist[j, i] = dist[j-1, i-1] + (j+1)*dist[j, i-1]
+    # The same small factorials recur O(n^2) times; look them up instead.
+    fac = [factorial(k) for k in range(n+1)]
     for i in range(n):
         for j in range(i+1):
-            dist[j, i] *= factorial(i+1)//factorial(i-j)
+            dist[j, i] *= fac[i+1]//fac[i-j]
     return dist
 
 imagedist_recurse = imagedist = lambda n: list(imagedists_upto(n)[:, -1])
 
 
+# The following lookup tables are cached, since they are rebuilt with the
+# same sizes by each call to the distribution functions. As the cached
+# arrays are shared, they are returned read-only.
+
+
+@lru_cache(maxsize=None)
 def nCk_grid(n):
     """nCk(i, j) == nCk_table[i, j] for 0 <= j <= i <= m. """
     binomial_coeffs = np.zeros((n+1, n+1), dtype=object)
@@ -109,15 +149,18 @@ def nCk_grid(n):
             if j > i:
                 continue
             binomial_coeffs[i, j] = combinat.nCk(i, j)
+    binomial_coeffs.flags.writeable = False
     return binomial_coeffs
 
 
+@lru_cache(maxsize=None)
 def powergrid(n):
     """i**j == powergrid[i, j] for 0 <= i, j <= n. Note 0**0 defined as 1."""
     base = np.arange(n+1, dtype=object)
     bases, exponents = np.meshgrid(base, base)
-    exponentials = bases**exponents
-    return exponentials.T
+    exponentials = bases.T**exponents.T
+    exponentials.flags.writeable = False
+    return exponentials
 
 
 def limitdist_composition(n):
@@ -146,8 +189,9 @@ def limitdist_composition(n):
             count *= exponentials[comp[i-1], comp[i]]
             count *= binomial_coefficients[sum(comp[i:]), comp[i]]
         dist[comp[0]-1] += count
+    fac = [factorial(k) for k in range(n+1)]
     for i in range(n, 0, -1):
-        dist[i-1] *= factorial(n)//factorial(n-i)
+        dist[i-1] *= fac[n]//fac[n-i]
     return tuple(dist)
 
 
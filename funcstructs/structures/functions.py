@@ -32,6 +32,20 @@ def identity(domain=None):
     return Permutation(zip(S, S))
 
 
+def _functype(image, size, domain):
+    """Most derived Function type for a map from a domain with the given
+    number of elements onto the given image set."""
+    invertible = len(image) == size
+    endomorphic = image.issubset(domain)
+    if invertible and endomorphic:
+        return Permutation
+    elif invertible:
+        return Bijection
+    elif endomorphic:
+        return Endofunction
+    return Function
+
+
 def _FunctionHelper(fcls):
     """Helper for making the Functional mapping type."""
 
@@ -41,17 +55,9 @@ def _FunctionHelper(fcls):
     def __new__(*args, **kwargs):
         cls = args[0]
         mapping = dict(*args[1:], **kwargs)
-        im = frozenset(mapping.values())
-        invertible = len(im) == len(mapping)
-        endomorphic = im.issubset(mapping.keys())
-        if invertible and endomorphic:
-            functype = Permutation
-        elif invertible:
-            functype = Bijection
-        elif endomorphic:
-            functype = Endofunction
-        else:
-            functype = Function
+        # test containment in the mapping to avoid a python2 list of keys
+        functype = _functype(
+            frozenset(mapping.values()), len(mapping), mapping)
         # Function, Bijection, Endofunction and Permutation should
         # collectively be thought of as "Function". Inputs are promoted
         # to the most derived type automatically, since ultimately,
@@ -107,6 +113,14 @@ def _FunctionHelper(fcls):
         return self
     fcls.__new__ = __new__
 
+    @classmethod
+    def _from_mapping(cls, mapping):
+        """Wrap a dict already known to define a cls, skipping all checks."""
+        self = object.__new__(cls)
+        map_set(self, mapping)
+        return self
+    fcls._from_mapping = _from_mapping
+
     global _FunctionHelper
     del _FunctionHelper
 
@@ -191,7 +205,10 @@ class Function(frozendict):
 
     def __mul__(self, other):
         """(f * g)[x] <==> f[g[x]]"""
-        return Function((x, self[y]) for x, y in other)
+        # Index a plain dict copy of f to skip the frozendict __getitem__
+        # wrapper for every point of the domain.
+        f = dict(self._items())
+        return Function((x, f[y]) for x, y in other)
 
     # Design Note: Function objects used to be callable; their __call__ method
     # was set to dict.__getitem__ and __getitem__ itself was disabled.
@@ -225,9 +242,9 @@ class Function(frozendict):
         """f.fibers[y] <==> {x for x in f.domain if f[x] == y}"""
         # TODO: Add preimage class
         preim = defaultdict(list)
-        for x, y in self:
+        for x, y in self._items():
             preim[y].append(x)
-        return frozendict((y, frozenset(preim[y])) for y in self.image())
+        return frozendict((y, frozenset(xs)) for y, xs in preim.items())
 
 
 class Bijection(Function):
@@ -286,28 +303,65 @@ class Endofunction(Function):
 
     __slots__ = ()
 
+    def __mul__(self, other):
+        """(f * g)[x] <==> f[g[x]]"""
+        if not (isinstance(other, Endofunction) and
+                self._keys() == other._keys()):
+            return super(Endofunction, self).__mul__(other)
+        # Endofunctions on a common domain compose to another one, which is
+        # invertible if and only if both of them are. The result type is
+        # thus known in advance, and need not be checked by Function.
+        if isinstance(self, Permutation) and isinstance(other, Permutation):
+            functype = Permutation
+        else:
+            functype = Endofunction
+        f = dict(self._items())
+        return functype._from_mapping(dict((x, f[y]) for x, y in other))
+
     def __pow__(self, n):
         """f**n <==> the nth iterate of f (n > 0)"""
-        f = self
-        f_iter = Permutation(zip(self.domain, self.domain))
+        if n == 0:
+            return Permutation(zip(self.domain, self.domain))
+        # Negative powers have always been treated as their absolute value;
+        # shifting a negative n would never terminate.
+        n = abs(n)
+        if n == 1:
+            return self
+        f = dict(self._items())
+        f_iter = None
         # Decompose f**n into the composition of power-of-2 iterates, akin to
-        # exponentiation by squaring.
-        for it in bin(n)[-1:1:-1]:
-            if it == '1':
-                f_iter *= f
-            f *= f
-        return f_iter
+        # exponentiation by squaring. The iterates are composed as plain
+        # dicts, and only the result is wrapped; it is invertible if and
+        # only if f is, so it has the same type.
+        while True:
+            if n & 1:
+                if f_iter is None:
+                    f_iter = f
+                else:
+                    f_iter = dict((x, f[y]) for x, y in f_iter.items())
+            n >>= 1
+            if not n:
+                break  # the next square would go unused
+            f = dict((x, f[y]) for x, y in f.items())
+        return self.__class__._from_mapping(f_iter)
 
     # TODO: eliminate this method, or use it only for testing
     # ConjugacyClass.imagepath
     def imagepath(self):
         """f.imagepath()[n] <==> len((f**n).image)"""
-        cardinalities = [len(self.image())]
-        f = self
-        card_prev = len(self)
+        image = self.image()
+        card_prev = len(image)
+        # If the image is a single point or the whole domain, f already maps
+        # its image onto itself, so no iterate can shrink it further.
+        if card_prev in {1, len(self)}:
+            return (card_prev, )*max(1, len(self)-1)
+        cardinalities = [card_prev]
+        # The image of f**(n+1) is the image of f**n under f, so iterate f
+        # on the shrinking image instead of composing whole functions.
+        f = dict(self._items()).__getitem__  # evaluate f at C speed in map
         for it in range(1, len(self)-1):
-            f *= self
-            card = len(f.image())
+            image = frozenset(map(f, image))
+            card = len(image)
             cardinalities.append(card)
             # Save some time; if we have reached the fixed set, return.
             if card == card_prev:
@@ -316,45 +370,65 @@ class Endofunction(Function):
             card_prev = card
         return tuple(cardinalities)
 
+    def _cycles(self):
+        """Return a list of f's cycles, each a list in iteration order."""
+        # Algorithm runs in O(len(self)). Each node is numbered in the
+        # order it is first visited. Following f from an unvisited node,
+        # the walk closes a new cycle if and only if it stops at a node
+        # numbered since the walk began; otherwise it ran into a tree or
+        # cycle found previously.
+        visit_order = {}
+        cycles = []
+        # Walk a plain dict copy of f; indexing it directly is much cheaper
+        # than going through frozendict's __getitem__ wrapper at every step.
+        f = dict(self._items())
+        for x in f:
+            if x in visit_order:
+                continue
+            start = len(visit_order)
+            path = []
+            while x not in visit_order:
+                visit_order[x] = start + len(path)
+                path.append(x)
+                x = f[x]
+            if visit_order[x] >= start:
+                cycles.append(path[visit_order[x]-start:])
+        return cycles
+
+    # Internal callers which merely iterate over the cycles use _cycles to
+    # avoid hashing every cycle into a frozenset.
+
     def cycles(self):
         """Return the set of f's cycles"""
-        # Algorithm runs in O(len(self))
-        tried = set()
-        remaining = set(self.domain)
-        cycles = []
-        while remaining:
-            x = remaining.pop()
-            path = [x]
-            i = 0
-            index = {x: i}
-            while x not in tried:
-                remaining.discard(x)
-                tried.add(x)
-                x = self[x]
-                if x not in index:
-                    path.append(x)
-                    i += 1
-                    index[x] = i
-                else:
-                    cycles.append(path[index[x]:])
-                    break
-        return frozenset(map(tuple, cycles))
+        return frozenset(map(tuple, self._cycles()))
 
     @property
     def limitset(self):
         """x in f.limitset <==> any(x in cycle for cycle in f.cycles)"""
-        return frozenset(itertools.chain(*self.cycles()))
+        return frozenset(itertools.chain.from_iterable(self._cycles()))
+
+    def _acyclic_preimage(self, cycles=None):
+        """Return a dict mapping each x to a list of its acyclic ancestors.
+
+        Callers which already have f._cycles() may pass them in to avoid
+        finding them again.
+        """
+        # Collect the ancestors in a single pass over f, rather than first
+        # building every fiber as a frozenset and then filtering them.
+        if cycles is None:
+            cycles = self._cycles()
+        descendants = dict((x, []) for x in self._keys())
+        lim = set(itertools.chain.from_iterable(cycles))
+        for x, y in self._items():
+            if x not in lim:
+                descendants[y].append(x)
+        return descendants
 
     @property
     def acyclic_ancestors(self):
         """f.acyclic_ancestors[y] <==> f.fibers[y] - f.limitset"""
-        descendants = defaultdict(list)
-        lim = self.limitset  # make local copy for speed
-        for y, inv_image in self.fibers._items():
-            for x in inv_image:
-                if x not in lim:
-                    descendants[y].append(x)
-        return frozendict((x, frozenset(descendants[x])) for x in self.domain)
+        return frozendict(
+            (y, frozenset(xs)) for y, xs in self._acyclic_preimage().items())
 
 
 class Permutation(Endofunction, Bijection):
@@ -446,12 +520,30 @@ class Mappings(Enumerable):
             domain, codomain = map(sorted, [self.domain, self.codomain])
         except TypeError:
             domain, codomain = map(tuple, [self.domain, self.codomain])
-        if not self.invertible:
-            for f in itertools.product(codomain, repeat=len(domain)):
-                yield Function(zip(domain, f))
-        else:
+        # Domains are already validated, and the type of each Function is
+        # inferred from the image directly, so skip the Function constructor.
+        if self.invertible:
+            if self.domain == self.codomain:
+                functype = Permutation
+            else:
+                functype = Bijection
             for f in itertools.permutations(codomain):
-                yield Bijection(zip(domain, f))
+                yield functype._from_mapping(dict(zip(domain, f)))
+        elif self.codomain.issubset(self.domain):
+            # Every such Function is an Endofunction, and it is a
+            # Permutation if and only if it is injective.
+            n = len(domain)
+            for f in itertools.product(codomain, repeat=n):
+                if len(set(f)) == n:
+                    functype = Permutation
+                else:
+                    functype = Endofunction
+                yield functype._from_mapping(dict(zip(domain, f)))
+        else:
+            n = len(domain)
+            for f in itertools.product(codomain, repeat=n):
+                functype = _functype(frozenset(f), n, self.domain)
+                yield functype._from_mapping(dict(zip(domain, f)))
 
     @typecheck(Function)
     def __contains__(self, other):
@@ -89,7 +89,7 @@ def _set_partitions(S, partition):
         for m, c in zip(mults, odiv):
             strand.append(_equipartitions(set(c), m))
         for bundle in product(*strand):
-            yield chain(*bundle)
+            yield chain.from_iterable(bundle)
 
 
 def set_partitions(partition, S=None):
@@ -11,6 +11,7 @@ from functools import reduce
 from itertools import chain, starmap, repeat
 from math import factorial
 from operator import itemgetter, mul
+from types import GeneratorType
 
 from funcstructs.compat import is_natural
 
@@ -18,6 +19,11 @@ from funcstructs.bases.frozendict import frozendict, _map_accessors
 
 __all__ = ["Multiset"]
 
+# Iterable types which are common Multiset inputs and are known not to be
+# Mappings. Matching them by exact type spares the comparatively slow ABC
+# instance check.
+_SEQUENCE_TYPES = frozenset([list, tuple, GeneratorType, chain])
+
 
 def _prod(iterable):
     """Product of all items in an iterable."""
@@ -80,7 +86,8 @@ def _MultisetHelper(ms_cls):
             if kwargs:
                 raise TypeError("Multiset does not accept iterable and kwargs")
             iterable = args[1]
-            if isinstance(iterable, Mapping):
+            if (type(iterable) not in _SEQUENCE_TYPES and
+                    isinstance(iterable, Mapping)):
                 mset.update(iterable)
                 check = True
             else:
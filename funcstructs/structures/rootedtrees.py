@@ -8,17 +8,17 @@ from math import factorial
 
 from funcstructs import bases
 from funcstructs.combinat import divisors, factorial_prod
-from funcstructs.compat import is_index, is_natural
-from funcstructs.utils.subsequences import startswith
+from funcstructs.compat import is_index, is_natural, lru_cache
 
-from funcstructs.structures.functions import rangefunc
+from funcstructs.structures.functions import (
+    rangefunc, Endofunction, Permutation)
 from funcstructs.structures.multiset import Multiset
 from funcstructs.structures.labellings import _ordered_divisions
 
 __all__ = "LevelSequence", "DominantSequence", "RootedTree", "TreeEnumerator"
 
 
-def _levels_from_preim(graph, root=0, keys=None):
+def _levels_from_preim(graph, root=0):
     """Return the level sequence of the ordered tree formed such that
     graph[x] are the nodes attached to x.
 
@@ -41,21 +41,35 @@ def _levels_from_preim(graph, root=0, keys=None):
     #       for x in graph[root]:
     #           seq.extend(levels(graph, x, level+1))
     #       return seq
-    if keys is not None:
-        for connections in graph:
-            connections.sort(key=keys.__getitem__)
-    node_stack = [root]
-    level = 0
-    node_levels = {root: level}
+    # Each node is pushed along with its level, so no separate record of
+    # node levels is needed.
+    node_stack = [(root, 0)]
+    push = node_stack.append
     while node_stack:
-        x = node_stack.pop()
-        level = node_levels[x]
+        x, level = node_stack.pop()
         yield level
         level += 1
         for y in graph[x]:
-            node_stack.append(y)
-            # Need to compute even for dominant tree, since levels will change
-            node_levels[y] = level
+            push((y, level))
+
+
+def _fold_levels(level_sequence, make):
+    """Build the tree with the given level sequence from the bottom up,
+    where make(children) forms a node from the list of its children."""
+    # Every node is built in a single pass over the level sequence with a
+    # managed stack, rather than recursing on each subtree, which re-scans
+    # its levels and is bounded by python's recursion limit. branches[k]
+    # collects the finished children of the most recent node at level k.
+    branches = [[]]
+    for level in level_sequence[1:]:
+        while len(branches) > level:
+            subtree = make(branches.pop())
+            branches[-1].append(subtree)
+        branches.append([])
+    while len(branches) > 1:
+        subtree = make(branches.pop())
+        branches[-1].append(subtree)
+    return make(branches[0])
 
 
 class LevelSequence(bases.Tuple):
@@ -117,12 +131,12 @@ class LevelSequence(bases.Tuple):
         of all noncyclic nodes whose iteration paths pass through node. If no
         node is specified, and the function does not have a unique cyclic
         element, a ValueError is raised."""
+        cycles = func._cycles()
         if root is None:
-            lim = func.limitset
-            if len(lim) != 1:
+            if len(cycles) != 1 or len(cycles[0]) != 1:
                 raise ValueError("Function structure is not a rooted tree")
-            root = next(iter(lim))
-        return cls(_levels_from_preim(func.acyclic_ancestors, root))
+            root = cycles[0][0]
+        return cls(_levels_from_preim(func._acyclic_preimage(cycles), root))
 
     def parents(self):
         """Generator of the parent nodes of each node in order."""
@@ -138,19 +152,22 @@ class LevelSequence(bases.Tuple):
 
     def children(self):
         """Map of each node to the set of nodes attached to it in order."""
-        preim = []
-        for node, parent in enumerate(self.parents()):
-            preim.append([])
-            preim[parent].append(node)
-        preim[0].pop(0)
+        # Inline the parents algorithm to fill preallocated lists in a single
+        # pass, instead of consuming the generator. The root is skipped, so
+        # it is never attached to itself and need not be removed afterwards.
+        preim = [[] for _ in self]
+        grafting_point = [0]*len(self)
+        nodes = enumerate(self)
+        next(nodes)
+        for node, level in nodes:
+            preim[grafting_point[level-1]].append(node)
+            grafting_point[level] = node
         return preim
 
     def height_groups(self):
         """Nodes in breadth-first traversal order grouped by height."""
-        groups = []
+        groups = [[] for _ in range(max(self)+1)]
         for node, height in enumerate(self):
-            if height+1 > len(groups):
-                groups.append([])
             groups[height].append(node)
         return groups
 
@@ -160,17 +177,27 @@ class LevelSequence(bases.Tuple):
 
     def subtrees(self):
         """Return the subtrees attached to the root."""
-        for branch in startswith(self[1:], self[0]+1):
+        # Each subtree starts at a node of level 1, so locate them all in
+        # one pass, then slice them out of a single shifted copy of the
+        # sequence.
+        starts = [node for node, level in enumerate(self) if level == 1]
+        starts.append(len(self))
+        shifted = [level-1 for level in self]
+        for start, stop in zip(starts, starts[1:]):
             # Bypass any constructor checks; since the tree is verified,
             # all of its subtrees must be as well.
-            yield tuple.__new__(self.__class__, (node-1 for node in branch))
+            yield tuple.__new__(self.__class__, shifted[start:stop])
 
     def traverse_map(self, mapping=list):
         """Apply mapping to the sequence of mapping applied to the subtrees."""
-        # The breaking condition here is implicit; if the tree has no subtrees,
-        # tree.traverse_map(mapping) is simply not called, returning
-        # the equivalent mapping(iter(())).
-        return mapping(tree.traverse_map(mapping) for tree in self.subtrees())
+        # Equivalent to the recursive version, which was as follows:
+        #
+        #   def traverse_map(self, mapping=list):
+        #       return mapping(tree.traverse_map(mapping)
+        #                      for tree in self.subtrees())
+        #
+        # A leaf becomes the equivalent of mapping(iter(())).
+        return _fold_levels(self, lambda children: mapping(iter(children)))
 
     # The following method for converting a rooted tree into canonical form
     # was independently rediscovered by Caleb Levy in Spring 2015. It is
@@ -186,10 +213,11 @@ class LevelSequence(bases.Tuple):
     # each level by using the list of their children as keys (the lists
     # are sorted lexicographically).
 
-    def _node_keys(self, sort=True):
+    def _node_keys(self, sort=True, parent=None):
         """Assign to each node a key for sorting"""
         # Leave option to input these to without computing for caching
-        parent = list(self.parents())
+        if parent is None:
+            parent = list(self.parents())
         node_keys = [0]*len(self)
         child_keys = [[] for _ in self]
         previous_level = []
@@ -222,12 +250,12 @@ class DominantSequence(LevelSequence):
     __slots__ = ()
 
     def __new__(cls, level_sequence):
-        ot = LevelSequence(level_sequence)
-        keys = ot._node_keys()
-        level_sequence = _levels_from_preim(ot.children(), 0, keys)
-        # No need to run LevelSequence checks; it's either been preordered or
-        # treefunc_properties will serve as an effective check due to indexing.
-        return super(LevelSequence, cls).__new__(cls, level_sequence)
+        # Validate before consulting the cache, so that sequences which
+        # merely compare equal to a valid one (such as floats) are rejected,
+        # and convert to int so that equal keys such as True and 1 cannot
+        # leak into each other's results.
+        level_sequence = tuple(map(int, LevelSequence(level_sequence)))
+        return tuple.__new__(cls, _dominant_sequence(level_sequence))
 
     def _interchangeable_nodes(self):
         """Groups of interchangeable nodes in BFS order."""
@@ -236,13 +264,17 @@ class DominantSequence(LevelSequence):
         # different aspects of tree structure: connections and height.
         parents = list(self.parents())
         bft = self.breadth_first_traversal()
-        keys = self._node_keys(sort=False)
+        keys = self._node_keys(sort=False, parent=parents)
         # Two nodes are interchangeable iff they have the same key and parent.
         # Interchangeable nodes will always be adjacent in the breadth
         # first traversal of a dominant sequence.
         for _, g in groupby(bft, lambda x: (parents[x], keys[x])):
             yield list(g)
 
+    # The same few trees recur throughout enumerations of function
+    # structures, so their degeneracies are memoized. The cache is bounded,
+    # since it holds on to every tree it has seen.
+    @lru_cache(maxsize=1 << 10)
     def degeneracy(self):
         """Number of equivalent representations for each labelling of the
         unordered tree."""
@@ -255,15 +287,43 @@ class DominantSequence(LevelSequence):
         """Enumerate endofunctions with the same tree structure."""
         node_groups = list(self._interchangeable_nodes())
         bin_widths = list(map(len, node_groups))
-        translation_sequence = rangefunc(chain(*node_groups)).inverse.conj(
+        translation = rangefunc(chain(*node_groups)).inverse.conj(
             rangefunc(self.parents()))
         n = len(self)
-        func = [0] * n
+        translation_sequence = [translation[i] for i in range(n)]
+        # Every labelling of a tree is an Endofunction (or the identity on
+        # a single node), so skip the type inference done by rangefunc.
+        functype = Endofunction if n > 1 else Permutation
         for combo in _ordered_divisions(set(range(n)), bin_widths):
-            c = list(chain(*combo))
-            for i in range(n):
-                func[c[i]] = c[translation_sequence[i]]
-            yield rangefunc(func)
+            c = list(chain.from_iterable(combo))
+            yield functype._from_mapping(
+                dict(zip(c, map(c.__getitem__, translation_sequence))))
+
+
+# The trees hanging off the nodes of functions are drawn from a small pool
+# of shapes, and the same orderings of them recur across functions, so
+# canonical forms are memoized on the input level sequence.
+@lru_cache(maxsize=1 << 12)
+def _dominant_sequence(level_sequence):
+    """DominantSequence from a tuple known to be a valid level sequence."""
+    # Every tree on three or fewer nodes has only one ordering. Such
+    # small trees make up most of those hanging off the cycles of a
+    # typical function, so skip sorting them.
+    if len(level_sequence) <= 3:
+        return tuple.__new__(DominantSequence, level_sequence)
+    ot = tuple.__new__(LevelSequence, level_sequence)
+    parents = list(ot.parents())
+    keys = ot._node_keys(parent=parents)
+    # Attaching the nodes to their parents in ascending order of key
+    # leaves every list of children already sorted, which saves sorting
+    # each of them separately in _levels_from_preim.
+    children = [[] for _ in ot]
+    for node in sorted(range(1, len(ot)), key=keys.__getitem__):
+        children[parents[node]].append(node)
+    level_sequence = _levels_from_preim(children)
+    # No need to run LevelSequence checks; it's either been preordered or
+    # treefunc_properties will serve as an effective check due to indexing.
+    return tuple.__new__(DominantSequence, level_sequence)
 
 
 class RootedTree(Multiset):
@@ -278,13 +338,28 @@ class RootedTree(Multiset):
 
     def __new__(cls, subtrees=()):
         if isinstance(subtrees, LevelSequence):
-            return subtrees.traverse_map(cls)
+            return cls._from_level_sequence(subtrees)
         self = super(RootedTree, cls).__new__(cls, subtrees)
         if not all(isinstance(tree, cls) for tree in self._keys()):
             raise TypeError(
                 "input must be list of RootedTrees or a LevelSequence")
         return self
 
+    @classmethod
+    def _from_level_sequence(cls, level_sequence):
+        # Equivalent to level_sequence.traverse_map(cls), except that the
+        # subtrees are known to be RootedTrees, so the type check is
+        # skipped. Equal subtrees are shared, so each distinct shape is
+        # stored only once.
+        new = super(RootedTree, cls).__new__
+        shared = {}
+
+        def make(subtrees):
+            tree = new(cls, subtrees)
+            return shared.setdefault(tree, tree)
+
+        return _fold_levels(level_sequence, make)
+
     def __bool__(self):
         return True  # All trees have roots, thus aren't empty
 
@@ -308,26 +383,87 @@ class RootedTree(Multiset):
 
     def degeneracy(self):
         """Return #(nodes)!/#(labellings)"""
+        return self._degeneracy({})
+
+    def _degeneracy(self, memo):
+        # Equal subtrees recur at different depths of a tree, so each
+        # distinct subtree is computed once per call. Their hashes are
+        # cached, so lookups are cheap.
+        try:
+            return memo[self]
+        except KeyError:
+            pass
         deg = super(RootedTree, self).degeneracy()
         for subtree, mult in self._items():
-            deg *= subtree.degeneracy()**mult
+            deg *= subtree._degeneracy(memo)**mult
+        memo[self] = deg
         return deg
 
-    def _ordered_level_sequence(self, level=0):
-        level_sequence = [level]
-        for tree, mult in self._items():
-            level_sequence.extend(tree._ordered_level_sequence(level+1) * mult)
+    def _ordered_level_sequence(self):
+        # Traverse using a managed stack rather than recursing on each
+        # subtree, which saves a python call per node. Subtrees are pushed
+        # straight onto the stack, so they come out in the reverse of the
+        # order of the recursive version below. Any order of the subtrees
+        # gives a valid level sequence of the same unordered tree, and the
+        # only caller puts it in dominant order anyway.
+        #
+        #   def levels(tree, level=0):
+        #       seq = [level]
+        #       for subtree, mult in tree._items():
+        #           seq.extend(levels(subtree, level+1) * mult)
+        #       return seq
+        level_sequence = []
+        tree_stack = [(self, 0)]
+        push = tree_stack.extend
+        while tree_stack:
+            tree, level = tree_stack.pop()
+            level_sequence.append(level)
+            level += 1
+            for subtree, mult in tree._items():
+                push([(subtree, level)] * mult)
         return level_sequence
 
     def __len__(self):
         """Number of nodes in the tree."""
-        return len(self._ordered_level_sequence())
+        # Count subtree sizes directly rather than flattening the tree into
+        # its level sequence just to measure it.
+        count = 1
+        for subtree, mult in self._items():
+            count += mult * len(subtree)
+        return count
 
     def ordered_form(self):
         """Return the dominant representative of the rooted tree."""
         return DominantSequence(self._ordered_level_sequence())
 
 
+# Otter's recurrence for the number T[n] of rooted trees on n nodes is
+#
+#   T[n] = sum(S[i]*T[n-i] for i in range(1, n)) // (n-1)
+#
+# with S[i] = sum(d*T[d] for d in divisors(i)). Both sequences are kept
+# between calls and only extended as needed, so each divisor sum is
+# computed once overall.
+_TREE_COUNTS = [0, 1]
+_TREE_DIVISOR_SUMS = [0]
+
+
+def _rooted_tree_count(n):
+    """Number of rooted trees on n nodes."""
+    global _TREE_COUNTS, _TREE_DIVISOR_SUMS
+    if n < len(_TREE_COUNTS):
+        return _TREE_COUNTS[n]
+    # Extend copies and publish them at the end, so concurrent callers
+    # never see, or append to, a partially extended table.
+    T, S = list(_TREE_COUNTS), list(_TREE_DIVISOR_SUMS)
+    for m in range(len(T), n+1):
+        for i in range(len(S), m):
+            S.append(sum(d*T[d] for d in divisors(i)))
+        T.append(sum(S[i]*T[m-i] for i in range(1, m)) // (m-1))
+    _TREE_COUNTS, _TREE_DIVISOR_SUMS = T, S
+    return T[n]
+
+
 class TreeEnumerator(bases.Enumerable):
     """Represents the class of unlabelled rooted trees on n nodes."""
 
@@ -406,13 +542,4 @@ class TreeEnumerator(bases.Enumerable):
         featured without derivation in Finch, S. R. "Otter's Tree Enumeration
         Constants." Section 5.6 in "Mathematical Constants", Cambridge,
         England: Cambridge University Press, pp. 295-316, 2003."""
-        T = [0, 1] + [0]*(self.n - 1)
-        for n in range(2, self.n + 1):
-            for i in range(1, self.n):
-                s = 0
-                for d in divisors(i):
-                    s += T[d]*d
-                s *= T[n-i]
-                T[n] += s
-            T[n] //= n-1
-        return T[-1]
+        return _rooted_tree_count(self.n)
@@ -32,6 +32,8 @@ class FrozendictClassTests(unittest.TestCase):
         self.assertNotIn('_mapping', dir(frozendict))
         self.assertNotIn('__slots__', dir(frozendict()))
         self.assertNotIn('_mapping', dir(frozendict()))
+        self.assertFalse(hasattr(frozendict, '_hash'))
+        self.assertNotIn('_hash', dir(frozendict()))
 
 
 class F(frozendict):
@@ -0,0 +1,52 @@
+"""Benchmarking the managed stack in _levels_from_preim.
+
+Compares the current stack of (node, level) pairs against the earlier
+version, which pushed bare nodes and recorded their levels in a dict.
+Both are run on a random bushy tree and on a path, each with 20000
+nodes.
+"""
+
+from __future__ import print_function
+
+import random
+import timeit
+
+from funcstructs.structures.rootedtrees import _levels_from_preim
+
+
+def levels_with_dict(graph, root=0):
+    """The level stack as it was before levels were pushed with nodes."""
+    node_stack = [root]
+    node_levels = {root: 0}
+    while node_stack:
+        x = node_stack.pop()
+        level = node_levels[x]
+        yield level
+        level += 1
+        for y in graph[x]:
+            node_stack.append(y)
+            node_levels[y] = level
+
+
+def random_tree(n):
+    """Children lists of a random recursive tree on range(n)."""
+    graph = [[] for _ in range(n)]
+    for x in range(1, n):
+        graph[random.randrange(x)].append(x)
+    return graph
+
+
+random.seed(0)
+n = 20000
+trees = [
+    ("bushy", random_tree(n)),
+    ("path", [[x+1] for x in range(n-1)] + [[]])
+]
+
+for name, graph in trees:
+    assert list(levels_with_dict(graph)) == list(_levels_from_preim(graph))
+    print(name + ":")
+    for levels in levels_with_dict, _levels_from_preim:
+        times = timeit.repeat(
+            lambda: list(levels(graph)), number=10, repeat=5)
+        print("    %-20s %.3fs" % (levels.__name__, min(times)))
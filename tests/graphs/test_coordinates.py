@@ -17,6 +17,9 @@ class Location2DTests(unittest.TestCase):
         p2 = Point(-1, 1)
         self.assertAlmostEqual(np.sqrt(2), p2.r)
         self.assertAlmostEqual(3*np.pi/4, p2.theta)
+        r, theta = p2.polar()
+        self.assertAlmostEqual(p2.r, r)
+        self.assertAlmostEqual(p2.theta, theta)
         # Test on arrays
         x = np.linspace(0, 1, 10)
         c = Coordinates(x, x)
@@ -43,6 +46,10 @@ class Location2DTests(unittest.TestCase):
             par.z,
             Coordinates.from_polar(par.r, par.theta).z
         )
+        np.testing.assert_allclose(
+            par.z,
+            Coordinates.from_polar(*par.polar()).z
+        )
         self.assertAlmostEqual(par.theta[-1], np.pi/4)
 
     def test_negation(self):
@@ -155,3 +162,15 @@ class CoordinateTests(unittest.TestCase):
             coords.z,
             Coordinates.from_polar(coords.r, coords.theta).z
         )
+
+    def test_components(self):
+        """Test that x and y are copies, independent of the inputs"""
+        x, y = np.arange(3.), np.arange(3.)**2
+        for coords in Coordinates(x, y), Coordinates._from_xy(x, y):
+            cx, cy = coords.x, coords.y
+            cx[0] = cy[0] = 1
+            np.testing.assert_allclose([0, 1, 2], coords.x)
+            np.testing.assert_allclose([0, 1, 4], coords.y)
+        x[0] = y[0] = 1
+        np.testing.assert_allclose([0, 1, 2], coords.x)
+        np.testing.assert_allclose([0, 1, 4], coords.y)
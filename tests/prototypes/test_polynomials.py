@@ -1,3 +1,6 @@
+from functools import reduce
+import itertools
+import operator
 import unittest
 
 from funcstructs.structures import multiset
@@ -39,6 +42,15 @@ class PolynomialTests(unittest.TestCase):
         for vec, power, val in zip(vecs, powers, vals):
             self.assertEqual(val, monomial_symmetric_polynomial(vec, power))
 
+        # Wide partitions are evaluated a level of terms at a time
+        x = [2, 3, 5, 7, 11, 13, 17]
+        powers = [1, 2, 3, 4, 5]
+        exponents = set(itertools.permutations(powers + [0]*(len(x)-5)))
+        brute = sum(
+            reduce(operator.mul, map(pow, x, e)) for e in exponents
+        )
+        self.assertEqual(brute, monomial_symmetric_polynomial(x, powers))
+
 
 class MultisetPolynomialTests(unittest.TestCase):
 
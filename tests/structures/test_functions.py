@@ -195,6 +195,18 @@ class EndofunctionTests(unittest.TestCase):
         for f, lim in zip(self.funcs, self.limitsets):
             self.assertEqual(f.imagepath()[-1], len(lim))
 
+    def test_long_rho_cycles(self):
+        """Check cycles reached through long tails are found correctly."""
+        n = 10**4
+        # Tail 0 -> 1 -> ... -> n-1 leading into the cycle n -> ... -> 2n-1
+        rho = rangefunc(list(range(1, 2*n)) + [n])
+        cycle = tuple(range(n, 2*n))
+        self.assertEqual(1, len(rho.cycles()))
+        self.assertEqual(set(cycle), rho.limitset)
+        (found, ) = rho.cycles()
+        start = found.index(n)
+        self.assertEqual(cycle, found[start:] + found[:start])
+
     def test_acyclic_ancestors_are_not_cyclic(self):
         """Make sure attached_treenodes returns nodes not in cycles."""
         for f, lim in zip(self.funcs, self.limitsets):
@@ -326,6 +338,17 @@ class CompositionTests(unittest.TestCase):
         self.assertEqual(f, e*b)
         self.assertEqual(f, b*e)
 
+    def test_endofunction_composition(self):
+        """Composites of endofunctions on a domain keep their exact type"""
+        for _ in range(20):
+            f, g = randfunc(10), randfunc(10)
+            s, t = randfunc(10, invertible=True), randfunc(10, invertible=True)
+            for x, y in [(f, g), (f, s), (s, f), (s, t)]:
+                composite = x * y
+                self.assertEqual(Function((i, x[y[i]]) for i in range(10)),
+                                 composite)
+                self.assertIs(type(Function(composite)), type(composite))
+
     def test_conjugation_types(self):
         """Test that conjugate of an object is the original type"""
         _, b, _, s = self.ids
@@ -389,3 +412,13 @@ class FunctionEnumeratorTests(unittest.TestCase):
                 self.assertDomainsCorrect(Isomorphisms(d, c))
                 self.assertDomainsCorrect(TransformationMonoid(d))
                 self.assertDomainsCorrect(SymmetricGroup(d))
+
+    def test_function_types(self):
+        """Check that enumerated functions have their most derived type."""
+        for (_, d), (_, c) in self.domranges:
+            mspaces = [Mappings(d, c), Mappings(d, d[:len(d)//2])]
+            if len(c) == len(d):
+                mspaces.extend([Isomorphisms(d, c), SymmetricGroup(d)])
+            for mspace in mspaces:
+                for f in mspace:
+                    self.assertIs(type(Function(f)), type(f))
@@ -137,6 +137,18 @@ class LevelSequenceTests(unittest.TestCase):
             DominantSequence([0, 1, 1, 2, 1, 2, 3, 1, 2, 3, 4])
         )
 
+    def test_dominance_cache(self):
+        """Test memoized orderings keep their input's class and int levels"""
+        for seq in [0, True, True], [0, 1, True, 2], [0, 1, 1]:
+            tree = DominantSequence(seq)
+            self.assertTrue(all(type(level) is int for level in tree))
+
+        class Dominant(DominantSequence):
+            __slots__ = ()
+
+        self.assertIs(Dominant, type(Dominant([0, 1, 2, 1])))
+        self.assertIs(DominantSequence, type(DominantSequence([0, 1, 2, 1])))
+
     def test_traverse_map(self):
         """Test the bracket representation of these rooted trees."""
         trees = [